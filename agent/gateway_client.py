@@ -4,33 +4,75 @@ Connects to AgentCore Gateway as an external MCP server, exposing shared tools
 (check_warranty_status, web_search) via the MCP protocol with JWT authentication.
 """
 
+import os
+import time
+
 import boto3
 from boto3.session import Session
+from botocore.config import Config
 
 from utils.aws_helpers import get_ssm_parameter
 
 boto_session = Session()
 REGION = boto_session.region_name
 
+# Gateway ID and URL are static once the gateway is deployed, so they are
+# cached for GATEWAY_CACHE_TTL seconds instead of hitting SSM / the control
+# plane on every request.
+GATEWAY_CACHE_TTL = int(os.environ.get("GATEWAY_CACHE_TTL", "300"))
+
+# One client per process so its connection pool (and TLS sessions) are reused
+# across requests; sized for the runtime's I/O thread pool.
+boto_config = Config(
+    max_pool_connections=128, retries={"max_attempts": 2, "mode": "adaptive"}
+)
+gateway_control_client = boto3.client(
+    "bedrock-agentcore-control", region_name=REGION, config=boto_config
+)
+
+_gateway_cache = {}
+
 
-def get_gateway_url(gateway_id: str = None) -> str:
+def _cached(key: str, fetch, force_fetch: bool = False):
+    """Return the cached value for key, calling fetch() if missing or expired."""
+    now = time.monotonic()
+    entry = _gateway_cache.get(key)
+    if entry and not force_fetch and entry[1] > now:
+        return entry[0]
+    value = fetch()
+    _gateway_cache[key] = (value, now + GATEWAY_CACHE_TTL)
+    return value
+
+
+def get_gateway_url(gateway_id: str = None, force_fetch: bool = False) -> str:
     """Get the AgentCore Gateway URL.
 
     Args:
         gateway_id: Optional gateway ID. If not provided, reads from SSM.
+        force_fetch: Bypass the cache and re-read the gateway ID and URL.
 
     Returns:
         The gateway URL string.
     """
     if not gateway_id:
-        gateway_id = get_ssm_parameter("/app/customersupport/agentcore/gateway_id")
+        gateway_id = _cached(
+            "/app/customersupport/agentcore/gateway_id",
+            lambda: get_ssm_parameter("/app/customersupport/agentcore/gateway_id"),
+            force_fetch,
+        )
 
-    gateway_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
-    gateway_response = gateway_client.get_gateway(gatewayIdentifier=gateway_id)
-    return gateway_response["gatewayUrl"]
+    return _cached(
+        f"gateway_url:{gateway_id}",
+        lambda: gateway_control_client.get_gateway(gatewayIdentifier=gateway_id)[
+            "gatewayUrl"
+        ],
+        force_fetch,
+    )
 
 
-def get_gateway_mcp_config(bearer_token: str, gateway_id: str = None) -> dict:
+def get_gateway_mcp_config(
+    bearer_token: str, gateway_id: str = None, force_fetch: bool = False
+) -> dict:
     """Build the MCP server configuration for AgentCore Gateway.
 
     This returns a config dict that can be used in ClaudeAgentOptions.mcp_servers.
@@ -38,6 +80,7 @@ def get_gateway_mcp_config(bearer_token: str, gateway_id: str = None) -> dict:
     Args:
         bearer_token: JWT bearer token for authentication.
         gateway_id: Optional gateway ID. If not provided, reads from SSM.
+        force_fetch: Bypass the cache and re-read the gateway ID and URL.
 
     Returns:
         MCP server configuration dict for use in ClaudeAgentOptions.
@@ -51,7 +94,7 @@ def get_gateway_mcp_config(bearer_token: str, gateway_id: str = None) -> dict:
             }
         )
     """
-    gateway_url = get_gateway_url(gateway_id)
+    gateway_url = get_gateway_url(gateway_id, force_fetch=force_fetch)
     return {
         "type": "http",
         "url": gateway_url,
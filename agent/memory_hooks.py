@@ -4,8 +4,15 @@ Unlike Strands Agents which uses HookProvider callbacks, Claude Agent SDK
 uses a manual retrieve/save pattern around the query() call.
 """
 
+import functools
 import logging
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 
 import boto3
 from bedrock_agentcore.memory import MemoryClient
@@ -24,16 +31,51 @@ SESSION_ID = str(uuid.uuid4())
 
 memory_client = MemoryClient(region_name=REGION)
 memory_name = "CustomerSupportMemory"
+_memory_id: Optional[str] = None
+
+# Queries shorter than this, or made only of stopwords ("hi", "thanks"),
+# skip memory retrieval entirely
+MIN_QUERY_LENGTH = 8
+_STOPWORDS = frozenset(
+    "a an and are can do hello hey hi i is it me my no ok okay please so "
+    "thank thanks that the this to yes you".split()
+)
+
+# Short-lived cache of retrieved context so repeated prompts within a
+# conversation don't re-query the memory store
+CONTEXT_CACHE_TTL = 60
+CONTEXT_CACHE_MAX_SIZE = 256
+_context_cache: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+_context_cache_lock = threading.Lock()
+
+# Shared pool for the extra per-namespace retrievals (the first namespace runs
+# on the calling thread). Every concurrent request shares it, so it is sized
+# to the runtime's I/O pool rather than to a single request.
+MEMORY_RETRIEVE_WORKERS = int(os.environ.get("MEMORY_RETRIEVE_WORKERS", "32"))
+_retrieve_pool = ThreadPoolExecutor(
+    max_workers=MEMORY_RETRIEVE_WORKERS, thread_name_prefix="memory-retrieve"
+)
+# Background pool so memory writes stay off the user-facing response path.
+# Queued writes are still flushed on interpreter exit, since executor worker
+# threads are joined at shutdown.
+_memory_write_pool = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="memory-write"
+)
 
 
 def create_or_get_memory_resource():
     """Create or retrieve the AgentCore Memory resource.
 
     Uses USER_PREFERENCE and SEMANTIC strategies for personalized support.
+    The validated memory ID is cached for the life of the process.
     """
+    global _memory_id
+    if _memory_id:
+        return _memory_id
     try:
         memory_id = get_ssm_parameter("/app/customersupport/agentcore/memory_id")
         memory_client.gmcp_client.get_memory(memoryId=memory_id)
+        _memory_id = memory_id
         return memory_id
     except Exception:
         try:
@@ -65,6 +107,7 @@ def create_or_get_memory_resource():
                 put_ssm_parameter("/app/customersupport/agentcore/memory_id", memory_id)
             except Exception as e:
                 raise e
+            _memory_id = memory_id
             return memory_id
         except Exception:
             return None
@@ -72,6 +115,8 @@ def create_or_get_memory_resource():
 
 def delete_memory(memory_id):
     """Delete a memory resource."""
+    global _memory_id
+    _memory_id = None
     try:
         ssm_client = boto3.client("ssm", region_name=REGION)
         memory_client.delete_memory(memory_id=memory_id)
@@ -104,8 +149,16 @@ class CustomerSupportMemoryManager:
         self.client = client
         self.actor_id = actor_id
         self.session_id = session_id
-        self.namespaces = {
-            i["type"]: i["namespaces"][0]
+
+    @functools.cached_property
+    def namespaces(self) -> dict:
+        """Memory namespaces by strategy type, resolved for this actor.
+
+        Fetched on first use so managers that never retrieve context skip the
+        get_memory_strategies() call.
+        """
+        return {
+            i["type"]: i["namespaces"][0].replace("{actorId}", self.actor_id)
             for i in self.client.get_memory_strategies(self.memory_id)
         }
 
@@ -118,41 +171,82 @@ class CustomerSupportMemoryManager:
         Returns:
             Formatted context string, or empty string if no context found.
         """
-        try:
-            all_context = []
+        if not query_text or len(query_text.strip()) < MIN_QUERY_LENGTH:
+            return ""
+        words = {w.strip("?!.,") for w in query_text.lower().split()}
+        if not words - _STOPWORDS:
+            return ""
 
-            for context_type, namespace in self.namespaces.items():
-                memories = self.client.retrieve_memories(
-                    memory_id=self.memory_id,
-                    namespace=namespace.format(actorId=self.actor_id),
-                    query=query_text,
-                    top_k=3,
-                )
-                for memory in memories:
-                    if isinstance(memory, dict):
-                        content = memory.get("content", {})
-                        if isinstance(content, dict):
-                            text = content.get("text", "").strip()
-                            if text:
-                                all_context.append(f"[{context_type.upper()}] {text}")
-
-            if all_context:
-                context_text = "\n".join(all_context)
-                logger.info(f"Retrieved {len(all_context)} customer context items")
-                return context_text
+        key = (self.memory_id, self.actor_id, query_text)
+        now = time.monotonic()
+        with _context_cache_lock:
+            entry = _context_cache.get(key)
+            if entry and entry[0] > now:
+                _context_cache.move_to_end(key)
+                return entry[1]
 
+        try:
+            items = list(self.namespaces.items())
+            futures = [
+                _retrieve_pool.submit(self._retrieve_one, ctx_type, ns, query_text)
+                for ctx_type, ns in items[1:]
+            ]
+            all_context = (
+                self._retrieve_one(items[0][0], items[0][1], query_text)
+                if items
+                else []
+            )
+            for future in futures:
+                all_context.extend(future.result())
         except Exception as e:
             logger.error(f"Failed to retrieve customer context: {e}")
+            return ""
+
+        context_text = "\n".join(all_context)
+        if all_context:
+            logger.info(f"Retrieved {len(all_context)} customer context items")
+
+        with _context_cache_lock:
+            _context_cache[key] = (now + CONTEXT_CACHE_TTL, context_text)
+            _context_cache.move_to_end(key)
+            while len(_context_cache) > CONTEXT_CACHE_MAX_SIZE:
+                _context_cache.popitem(last=False)
+        return context_text
 
-        return ""
+    def _retrieve_one(self, context_type: str, namespace: str, query_text: str) -> list:
+        """Retrieve memories from a single namespace as tagged text lines."""
+        memories = self.client.retrieve_memories(
+            memory_id=self.memory_id,
+            namespace=namespace,
+            query=query_text,
+            top_k=3,
+        )
+        texts = []
+        for memory in memories:
+            if isinstance(memory, dict):
+                content = memory.get("content", {})
+                if isinstance(content, dict):
+                    text = content.get("text", "").strip()
+                    if text:
+                        texts.append(f"[{context_type.upper()}] {text}")
+        return texts
 
-    def save_interaction(self, user_query: str, agent_response: str):
-        """Save a customer support interaction to memory.
+    def save_interaction(self, user_query: str, agent_response: str) -> Future:
+        """Save a customer support interaction to memory in the background.
+
+        The write is submitted to a background pool and failures are logged,
+        not raised. Call .result() on the returned future to wait for it.
 
         Args:
             user_query: The customer's query.
             agent_response: The agent's response text.
+
+        Returns:
+            Future for the background write.
         """
+        return _memory_write_pool.submit(self._do_save, user_query, agent_response)
+
+    def _do_save(self, user_query: str, agent_response: str):
         try:
             if user_query and agent_response:
                 self.client.create_event(
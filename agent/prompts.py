@@ -2,6 +2,10 @@
 
 MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 
+# The Claude Code CLI behind the Agent SDK marks the system prompt and tool
+# definitions as a prompt-cache prefix on Bedrock. Keep SYSTEM_PROMPT static
+# (no timestamps, IDs or per-request formatting) so that prefix stays
+# byte-identical across requests and is served from cache.
 SYSTEM_PROMPT = """You are a helpful and professional customer support assistant for an electronics e-commerce company.
 Your role is to:
 - Provide accurate information using the tools available to you
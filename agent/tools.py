@@ -1,12 +1,208 @@
 """Customer support tools using Claude Agent SDK @tool decorator."""
 
-import json
+import asyncio
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
 
 import boto3
+import orjson
+from botocore.config import Config
 from claude_agent_sdk import tool
 from ddgs import DDGS
 from ddgs.exceptions import DDGSException, RatelimitException
 
+boto_session = boto3.Session()
+REGION = boto_session.region_name
+
+# Clients are created once per process; boto3 clients are thread-safe and
+# reusing them keeps their HTTP connection pools warm across tool calls.
+boto_config = Config(
+    max_pool_connections=32, retries={"max_attempts": 2, "mode": "standard"}
+)
+ssm_client = boto3.client("ssm", region_name=REGION, config=boto_config)
+sts_client = boto3.client("sts", region_name=REGION, config=boto_config)
+bedrock_agent_client = boto3.client(
+    "bedrock-agent-runtime", region_name=REGION, config=boto_config
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_account_id() -> str:
+    """Return the current AWS account ID, resolved once per process."""
+    return sts_client.get_caller_identity()["Account"]
+
+
+# Knowledge base retrieval: fetch a few extra candidates, keep the top
+# KB_MAX_RESULTS that clear the relevance threshold
+KB_CANDIDATES = 5
+KB_MAX_RESULTS = 3
+KB_MIN_SCORE = 0.4
+
+_kb_id: Optional[str] = None
+_kb_id_lock = threading.Lock()
+
+
+def _resolve_kb_id() -> str:
+    """Return the knowledge base ID from SSM, cached after the first lookup."""
+    global _kb_id
+    if _kb_id is not None:
+        return _kb_id
+    with _kb_id_lock:
+        if _kb_id is None:
+            name = f"/{_get_account_id()}-{REGION}/kb/knowledge-base-id"
+            _kb_id = ssm_client.get_parameter(Name=name)["Parameter"]["Value"]
+    return _kb_id
+
+
+def _retrieve_kb(query: str) -> dict:
+    """Query the knowledge base (blocking; tools call it via asyncio.to_thread)."""
+    return bedrock_agent_client.retrieve(
+        knowledgeBaseId=_resolve_kb_id(),
+        retrievalQuery={"text": query},
+        retrievalConfiguration={
+            "vectorSearchConfiguration": {
+                "numberOfResults": KB_CANDIDATES,
+                "overrideSearchType": "HYBRID",
+            }
+        },
+    )
+
+
+# Shared DuckDuckGo client plus a small TTL/LRU cache of recent searches,
+# since agent loops often repeat the same query within a conversation.
+ddgs_client = DDGS()
+
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_MAX_SIZE = 128
+
+_search_cache: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(keywords: str, region: str, max_results: int) -> str:
+    """Run a DuckDuckGo text search, serving repeated queries from cache."""
+    key = (keywords, region, max_results)
+    now = time.monotonic()
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry and entry[0] > now:
+            _search_cache.move_to_end(key)
+            return entry[1]
+
+    results = ddgs_client.text(keywords, region=region, max_results=max_results)
+    text = orjson.dumps(results).decode() if results else "No results found."
+
+    with _search_cache_lock:
+        _search_cache[key] = (now + SEARCH_CACHE_TTL, text)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_MAX_SIZE:
+            _search_cache.popitem(last=False)
+    return text
+
+
+# Static catalog data. Tool responses are rendered once at import time so
+# each call is a dict lookup instead of re-formatting the same text.
+RETURN_POLICIES = {
+    "smartphones": {
+        "window": "30 days",
+        "condition": "Original packaging, no physical damage, factory reset required",
+        "process": "Online RMA portal or technical support",
+        "refund_time": "5-7 business days after inspection",
+        "shipping": "Free return shipping, prepaid label provided",
+        "warranty": "1-year manufacturer warranty included",
+    },
+    "laptops": {
+        "window": "30 days",
+        "condition": "Original packaging, all accessories, no software modifications",
+        "process": "Technical support verification required before return",
+        "refund_time": "7-10 business days after inspection",
+        "shipping": "Free return shipping with original packaging",
+        "warranty": "1-year manufacturer warranty, extended options available",
+    },
+    "accessories": {
+        "window": "30 days",
+        "condition": "Unopened packaging preferred, all components included",
+        "process": "Online return portal",
+        "refund_time": "3-5 business days after receipt",
+        "shipping": "Customer pays return shipping under $50",
+        "warranty": "90-day manufacturer warranty",
+    },
+}
+
+DEFAULT_RETURN_POLICY = {
+    "window": "30 days",
+    "condition": "Original condition with all included components",
+    "process": "Contact technical support",
+    "refund_time": "5-7 business days after inspection",
+    "shipping": "Return shipping policies vary",
+    "warranty": "Standard manufacturer warranty applies",
+}
+
+
+def _render_policy_body(policy: dict) -> str:
+    return (
+        f"* Return window: {policy['window']} from delivery\n"
+        f"* Condition: {policy['condition']}\n"
+        f"* Process: {policy['process']}\n"
+        f"* Refund timeline: {policy['refund_time']}\n"
+        f"* Shipping: {policy['shipping']}\n"
+        f"* Warranty: {policy['warranty']}"
+    )
+
+
+_DEFAULT_POLICY_BODY = _render_policy_body(DEFAULT_RETURN_POLICY)
+_RETURN_POLICY_TEXT = {
+    sys.intern(category): f"Return Policy - {category.title()}:\n\n{_render_policy_body(policy)}"
+    for category, policy in RETURN_POLICIES.items()
+}
+
+PRODUCTS = {
+    "laptops": {
+        "warranty": "1-year manufacturer warranty + optional extended coverage",
+        "specs": "Intel/AMD processors, 8-32GB RAM, SSD storage, various display sizes",
+        "features": "Backlit keyboards, USB-C/Thunderbolt, Wi-Fi 6, Bluetooth 5.0",
+        "compatibility": "Windows 11, macOS, Linux support varies by model",
+        "support": "Technical support and driver updates included",
+    },
+    "smartphones": {
+        "warranty": "1-year manufacturer warranty",
+        "specs": "5G/4G connectivity, 128GB-1TB storage, multiple camera systems",
+        "features": "Wireless charging, water resistance, biometric security",
+        "compatibility": "iOS/Android, carrier unlocked options available",
+        "support": "Software updates and technical support included",
+    },
+    "headphones": {
+        "warranty": "1-year manufacturer warranty",
+        "specs": "Wired/wireless options, noise cancellation, 20Hz-20kHz frequency",
+        "features": "Active noise cancellation, touch controls, voice assistant",
+        "compatibility": "Bluetooth 5.0+, 3.5mm jack, USB-C charging",
+        "support": "Firmware updates via companion app",
+    },
+    "monitors": {
+        "warranty": "3-year manufacturer warranty",
+        "specs": "4K/1440p/1080p resolutions, IPS/OLED panels, various sizes",
+        "features": "HDR support, high refresh rates, adjustable stands",
+        "compatibility": "HDMI, DisplayPort, USB-C inputs",
+        "support": "Color calibration and technical support",
+    },
+}
+
+_PRODUCT_INFO_TEXT = {
+    sys.intern(product_type): (
+        f"Technical Information - {product_type.title()}:\n\n"
+        f"* Warranty: {product['warranty']}\n"
+        f"* Specifications: {product['specs']}\n"
+        f"* Key Features: {product['features']}\n"
+        f"* Compatibility: {product['compatibility']}\n"
+        f"* Support: {product['support']}"
+    )
+    for product_type, product in PRODUCTS.items()
+}
+
 
 @tool(
     name="get_return_policy",
@@ -25,53 +221,15 @@ from ddgs.exceptions import DDGSException, RatelimitException
 async def get_return_policy(args):
     """Get return policy information for a specific product category."""
     product_category = args["product_category"]
-    return_policies = {
-        "smartphones": {
-            "window": "30 days",
-            "condition": "Original packaging, no physical damage, factory reset required",
-            "process": "Online RMA portal or technical support",
-            "refund_time": "5-7 business days after inspection",
-            "shipping": "Free return shipping, prepaid label provided",
-            "warranty": "1-year manufacturer warranty included",
-        },
-        "laptops": {
-            "window": "30 days",
-            "condition": "Original packaging, all accessories, no software modifications",
-            "process": "Technical support verification required before return",
-            "refund_time": "7-10 business days after inspection",
-            "shipping": "Free return shipping with original packaging",
-            "warranty": "1-year manufacturer warranty, extended options available",
-        },
-        "accessories": {
-            "window": "30 days",
-            "condition": "Unopened packaging preferred, all components included",
-            "process": "Online return portal",
-            "refund_time": "3-5 business days after receipt",
-            "shipping": "Customer pays return shipping under $50",
-            "warranty": "90-day manufacturer warranty",
-        },
-    }
-
-    default_policy = {
-        "window": "30 days",
-        "condition": "Original condition with all included components",
-        "process": "Contact technical support",
-        "refund_time": "5-7 business days after inspection",
-        "shipping": "Return shipping policies vary",
-        "warranty": "Standard manufacturer warranty applies",
-    }
-
-    policy = return_policies.get(product_category.lower(), default_policy)
-    result = (
-        f"Return Policy - {product_category.title()}:\n\n"
-        f"* Return window: {policy['window']} from delivery\n"
-        f"* Condition: {policy['condition']}\n"
-        f"* Process: {policy['process']}\n"
-        f"* Refund timeline: {policy['refund_time']}\n"
-        f"* Shipping: {policy['shipping']}\n"
-        f"* Warranty: {policy['warranty']}"
+    # Models usually send lowercase categories, so try the exact key first
+    text = _RETURN_POLICY_TEXT.get(product_category) or _RETURN_POLICY_TEXT.get(
+        product_category.lower()
     )
-    return {"content": [{"type": "text", "text": result}]}
+    if text is None:
+        text = (
+            f"Return Policy - {product_category.title()}:\n\n{_DEFAULT_POLICY_BODY}"
+        )
+    return {"content": [{"type": "text", "text": text}]}
 
 
 @tool(
@@ -91,39 +249,10 @@ async def get_return_policy(args):
 async def get_product_info(args):
     """Get detailed technical specifications and information for electronics products."""
     product_type = args["product_type"]
-    products = {
-        "laptops": {
-            "warranty": "1-year manufacturer warranty + optional extended coverage",
-            "specs": "Intel/AMD processors, 8-32GB RAM, SSD storage, various display sizes",
-            "features": "Backlit keyboards, USB-C/Thunderbolt, Wi-Fi 6, Bluetooth 5.0",
-            "compatibility": "Windows 11, macOS, Linux support varies by model",
-            "support": "Technical support and driver updates included",
-        },
-        "smartphones": {
-            "warranty": "1-year manufacturer warranty",
-            "specs": "5G/4G connectivity, 128GB-1TB storage, multiple camera systems",
-            "features": "Wireless charging, water resistance, biometric security",
-            "compatibility": "iOS/Android, carrier unlocked options available",
-            "support": "Software updates and technical support included",
-        },
-        "headphones": {
-            "warranty": "1-year manufacturer warranty",
-            "specs": "Wired/wireless options, noise cancellation, 20Hz-20kHz frequency",
-            "features": "Active noise cancellation, touch controls, voice assistant",
-            "compatibility": "Bluetooth 5.0+, 3.5mm jack, USB-C charging",
-            "support": "Firmware updates via companion app",
-        },
-        "monitors": {
-            "warranty": "3-year manufacturer warranty",
-            "specs": "4K/1440p/1080p resolutions, IPS/OLED panels, various sizes",
-            "features": "HDR support, high refresh rates, adjustable stands",
-            "compatibility": "HDMI, DisplayPort, USB-C inputs",
-            "support": "Color calibration and technical support",
-        },
-    }
-
-    product = products.get(product_type.lower())
-    if not product:
+    result = _PRODUCT_INFO_TEXT.get(product_type) or _PRODUCT_INFO_TEXT.get(
+        product_type.lower()
+    )
+    if not result:
         text = (
             f"Technical specifications for {product_type} not available. "
             "Please contact our technical support team for detailed product "
@@ -131,14 +260,6 @@ async def get_product_info(args):
         )
         return {"content": [{"type": "text", "text": text}]}
 
-    result = (
-        f"Technical Information - {product_type.title()}:\n\n"
-        f"* Warranty: {product['warranty']}\n"
-        f"* Specifications: {product['specs']}\n"
-        f"* Key Features: {product['features']}\n"
-        f"* Compatibility: {product['compatibility']}\n"
-        f"* Support: {product['support']}"
-    )
     return {"content": [{"type": "text", "text": result}]}
 
 
@@ -172,8 +293,8 @@ async def web_search(args):
     region = args.get("region", "us-en")
     max_results = args.get("max_results", 5)
     try:
-        results = DDGS().text(keywords, region=region, max_results=max_results)
-        text = json.dumps(results) if results else "No results found."
+        # Blocking HTTP call; run it off the event loop shared by all requests
+        text = await asyncio.to_thread(_cached_search, keywords, region, max_results)
     except RatelimitException:
         text = "Rate limit reached. Please try again later."
     except DDGSException as e:
@@ -201,32 +322,17 @@ async def get_technical_support(args):
     """Search the knowledge base for technical support documentation."""
     issue_description = args["issue_description"]
     try:
-        ssm = boto3.client("ssm")
-        account_id = boto3.client("sts").get_caller_identity()["Account"]
-        region = boto3.Session().region_name
-
-        kb_id = ssm.get_parameter(
-            Name=f"/{account_id}-{region}/kb/knowledge-base-id"
-        )["Parameter"]["Value"]
-
-        bedrock_agent = boto3.client("bedrock-agent-runtime", region_name=region)
-        response = bedrock_agent.retrieve(
-            knowledgeBaseId=kb_id,
-            retrievalQuery={"text": issue_description},
-            retrievalConfiguration={
-                "vectorSearchConfiguration": {
-                    "numberOfResults": 3,
-                    "overrideSearchType": "HYBRID",
-                }
-            },
-        )
+        response = await asyncio.to_thread(_retrieve_kb, issue_description)
 
         results = []
         for result in response.get("retrievalResults", []):
+            if result.get("score", 0) < KB_MIN_SCORE:
+                continue
             content = result.get("content", {}).get("text", "")
-            score = result.get("score", 0)
-            if content and score >= 0.4:
+            if content:
                 results.append(content)
+                if len(results) >= KB_MAX_RESULTS:
+                    break
 
         if results:
             text = "\n\n---\n\n".join(results)
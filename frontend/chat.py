@@ -6,6 +6,7 @@ import uuid
 import urllib.parse
 from typing import Any, Optional
 
+import orjson
 import requests
 import streamlit as st
 from chat_utils import (
@@ -15,6 +16,10 @@ from chat_utils import (
     get_ssm_parameter,
 )
 
+# Shared session so repeated invocations reuse the TLS connection to the
+# AgentCore endpoint instead of re-handshaking per message.
+http_session = requests.Session()
+
 
 def invoke_endpoint_streaming(
     agent_arn: str,
@@ -34,16 +39,16 @@ def invoke_endpoint_streaming(
     }
 
     try:
-        body = json.loads(payload) if isinstance(payload, str) else payload
-    except json.JSONDecodeError:
+        body = orjson.loads(payload) if isinstance(payload, str) else payload
+    except orjson.JSONDecodeError:
         body = {"payload": payload}
 
     try:
-        response = requests.post(
+        response = http_session.post(
             url,
             params={"qualifier": endpoint_name},
             headers=headers,
-            json=body,
+            data=orjson.dumps(body),
             timeout=100,
             stream=True,
         )
@@ -53,6 +58,13 @@ def invoke_endpoint_streaming(
             for line in response.iter_lines(chunk_size=1, decode_unicode=True):
                 if line and line.startswith("data: "):
                     chunk = line[6:]
+                    # The runtime sends each text chunk as a JSON string so
+                    # multi-line text fits in one event
+                    if chunk.startswith('"'):
+                        try:
+                            chunk = orjson.loads(chunk)
+                        except orjson.JSONDecodeError:
+                            pass
                     if chunk.strip():
                         yield chunk
         else:
@@ -128,7 +140,7 @@ class ChatManager:
             body = {"payload": payload}
 
         try:
-            response = requests.post(
+            response = http_session.post(
                 url,
                 params={"qualifier": endpoint_name},
                 headers=headers,
@@ -164,7 +176,7 @@ class ChatManager:
             body = {"payload": payload}
 
         try:
-            response = requests.post(
+            response = http_session.post(
                 url,
                 params={"qualifier": endpoint_name},
                 headers=headers,
@@ -172,20 +184,18 @@ class ChatManager:
                 timeout=100,
                 stream=True,
             )
-            last_data = False
             for line in response.iter_lines(chunk_size=1):
-                if line:
-                    line = line.decode("utf-8")
-                    if line.startswith("data: "):
-                        last_data = True
-                        line = line[6:]
-                        line = line.replace('"', "")
-                        yield line
-                    elif line:
-                        line = line.replace('"', "")
-                        if last_data:
-                            yield "\n" + line
-                        last_data = False
+                if line and line.startswith(b"data: "):
+                    chunk = line[6:]
+                    # Text chunks arrive as JSON strings (newlines and quotes
+                    # escaped), so each event is exactly one data: line
+                    if chunk.startswith(b'"'):
+                        try:
+                            yield orjson.loads(chunk)
+                            continue
+                        except orjson.JSONDecodeError:
+                            pass
+                    yield chunk.decode("utf-8")
 
         except requests.exceptions.RequestException as e:
             print("Failed to invoke agent endpoint: %s", str(e))
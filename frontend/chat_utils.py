@@ -99,15 +99,19 @@ def read_config(file_path: str) -> Dict[str, Any]:
         raise ValueError(f"Error reading configuration file {file_path}: {e}")
 
 
-def make_urls_clickable(text):
-    """Convert URLs in text to clickable HTML links."""
-    url_pattern = r"https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?"
+URL_RE = re.compile(
+    r"https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?"
+)
+
 
-    def replace_url(match):
-        url = match.group(0)
-        return f'<a href="{url}" target="_blank" style="color:#4fc3f7;text-decoration:underline;">{url}</a>'
+def _replace_url(match):
+    url = match.group(0)
+    return f'<a href="{url}" target="_blank" style="color:#4fc3f7;text-decoration:underline;">{url}</a>'
 
-    return re.sub(url_pattern, replace_url, text)
+
+def make_urls_clickable(text):
+    """Convert URLs in text to clickable HTML links."""
+    return URL_RE.sub(_replace_url, text)
 
 
 def create_safe_markdown_text(text, message_placeholder):
@@ -6,6 +6,7 @@ to the AgentCore Runtime endpoint running the Claude Agent SDK agent.
 
 import json
 import os
+import re
 import sys
 import time
 import uuid
@@ -22,14 +23,27 @@ sys.path.append(project_root)
 
 from utils.aws_helpers import get_customer_support_secret
 
-secret = get_customer_support_secret()
-secret = json.loads(secret)
 
-authenticator = CognitoAuthenticator(
-    pool_id=secret["pool_id"],
-    app_client_id=secret["client_id"],
-    app_client_secret=secret["client_secret"],
-    use_cookies=False,
+# Streamlit reruns this script on every interaction; cache the Secrets
+# Manager lookup and the authenticator so they are built once per process.
+@st.cache_resource
+def load_secret():
+    return json.loads(get_customer_support_secret())
+
+
+@st.cache_resource
+def get_authenticator(pool_id, client_id, client_secret):
+    return CognitoAuthenticator(
+        pool_id=pool_id,
+        app_client_id=client_id,
+        app_client_secret=client_secret,
+        use_cookies=False,
+    )
+
+
+secret = load_secret()
+authenticator = get_authenticator(
+    secret["pool_id"], secret["client_id"], secret["client_secret"]
 )
 
 is_logged_in = authenticator.login()
@@ -42,20 +56,30 @@ def logout():
 
 
 CONTEXT_WINDOW = 10
+ROLE_PREFIX = {"user": "User: ", "assistant": "Assistant: "}
+
+# Streaming render budget: redraw at most every RENDER_INTERVAL seconds
+# unless RENDER_MIN_CHARS new characters have arrived.
+RENDER_INTERVAL = 0.08
+RENDER_MIN_CHARS = 256
+
+# Unquoted so they match whether the marker event arrives JSON-encoded or
+# already decoded by invoke_endpoint_streaming
+BEGIN_MARKER = "Begin agent execution"
+END_MARKER = "End agent execution"
+JSON_DECODER = json.JSONDecoder()
+
+ESCAPE_RE = re.compile(r'\\(["ntr])')
+ESCAPES = {'"': '"', "n": "\n", "t": "\t", "r": "\r"}
 
 
 def build_context(messages, context_window=CONTEXT_WINDOW):
     """Build context string from recent message history."""
-    history = (
-        messages[-context_window * 2 :]
-        if len(messages) > context_window * 2
-        else messages
+    start = max(0, len(messages) - context_window * 2)
+    return "".join(
+        f"{ROLE_PREFIX.get(msg['role'], 'Assistant: ')}{msg['content']}\n"
+        for msg in messages[start:]
     )
-    context = ""
-    for msg in history:
-        role = "User" if msg["role"] == "user" else "Assistant"
-        context += f"{role}: {msg['content']}\n"
-    return context
 
 
 def format_response_text(text):
@@ -64,11 +88,7 @@ def format_response_text(text):
         return text
     if text.startswith('"') and text.endswith('"'):
         text = text[1:-1]
-    text = text.replace('\\"', '"')
-    text = text.replace("\\n", "\n")
-    text = text.replace("\\t", "\t")
-    text = text.replace("\\r", "\r")
-    return text
+    return ESCAPE_RE.sub(lambda m: ESCAPES[m.group(1)], text)
 
 
 with st.sidebar:
@@ -93,9 +113,7 @@ if prompt := st.chat_input("How can I help you today?"):
     with st.chat_message("user"):
         st.markdown(prompt)
     st.session_state.messages.append({"role": "user", "content": prompt})
-    payload = json.dumps(
-        {"prompt": prompt, "actor_id": st.session_state["auth_username"]}
-    )
+    payload = {"prompt": prompt, "actor_id": st.session_state["auth_username"]}
 
     with st.chat_message("assistant"):
         message_placeholder = st.empty()
@@ -105,7 +123,7 @@ if prompt := st.chat_input("How can I help you today?"):
         try:
             session_id = st.session_state.get("session_id")
             context = build_context(st.session_state.messages, CONTEXT_WINDOW)
-            payload = json.dumps({"prompt": context})
+            payload = {"prompt": context}
             bearer_token = st.session_state.get("auth_access_token")
 
             message_placeholder.markdown(
@@ -115,6 +133,15 @@ if prompt := st.chat_input("How can I help you today?"):
 
             chunk_count = 0
             formatted_response = ""
+            last_render_ts = 0.0
+            last_render_len = 0
+            # URLs never contain whitespace, so text up to the last whitespace
+            # can be linkified once and reused across renders.
+            clickable_prefix = ""
+            clickable_len = 0
+            # Only the unscanned suffix (plus marker overlap) is searched for
+            # the end marker on each chunk.
+            scan_pos = 0
 
             for chunk in invoke_endpoint_streaming(
                 agent_arn=st.session_state["agent_arn"],
@@ -127,46 +154,35 @@ if prompt := st.chat_input("How can I help you today?"):
                     accumulated_response += chunk
                     chunk_count += 1
 
-                    if '"End agent execution"' in accumulated_response:
+                    end_pos = accumulated_response.find(END_MARKER, scan_pos)
+                    scan_pos = max(0, len(accumulated_response) - len(END_MARKER) + 1)
+
+                    if end_pos != -1:
                         message_placeholder.markdown(
                             '<span class="thinking-bubble">Processing response...</span>',
                             unsafe_allow_html=True,
                         )
 
                         try:
-                            begin_marker = '"Begin agent execution"'
-                            end_marker = '"End agent execution"'
-                            begin_pos = accumulated_response.find(begin_marker)
-                            end_pos = accumulated_response.find(end_marker)
+                            begin_pos = accumulated_response.find(BEGIN_MARKER)
 
-                            if begin_pos != -1 and end_pos != -1:
+                            if begin_pos != -1:
                                 json_part = accumulated_response[
-                                    begin_pos + len(begin_marker) : end_pos
-                                ].strip()
+                                    begin_pos + len(BEGIN_MARKER) : end_pos
+                                ]
                                 json_start = json_part.find('{"role":')
                                 if json_start != -1:
-                                    json_str = json_part[json_start:]
-                                    brace_count = 0
-                                    json_end = -1
-                                    for i, char in enumerate(json_str):
-                                        if char == "{":
-                                            brace_count += 1
-                                        elif char == "}":
-                                            brace_count -= 1
-                                            if brace_count == 0:
-                                                json_end = i + 1
-                                                break
-                                    if json_end != -1:
-                                        json_str = json_str[:json_end]
-                                        response_data = json.loads(json_str)
-                                        if (
-                                            "content" in response_data
-                                            and len(response_data["content"]) > 0
-                                            and "text" in response_data["content"][0]
-                                        ):
-                                            formatted_response = response_data[
-                                                "content"
-                                            ][0]["text"]
+                                    response_data, _ = JSON_DECODER.raw_decode(
+                                        json_part, json_start
+                                    )
+                                    if (
+                                        "content" in response_data
+                                        and len(response_data["content"]) > 0
+                                        and "text" in response_data["content"][0]
+                                    ):
+                                        formatted_response = response_data[
+                                            "content"
+                                        ][0]["text"]
 
                         except (json.JSONDecodeError, KeyError, IndexError) as e:
                             print(f"JSON parsing error: {e}")
@@ -174,13 +190,33 @@ if prompt := st.chat_input("How can I help you today?"):
                         break
 
                     else:
-                        streaming_text = accumulated_response
-                        clickable_streaming_text = make_urls_clickable(streaming_text)
-                        message_placeholder.markdown(
-                            f'<div class="assistant-bubble streaming typing-cursor">{clickable_streaming_text}</div>',
-                            unsafe_allow_html=True,
-                        )
-                        time.sleep(0.02)
+                        now = time.time()
+                        if (
+                            now - last_render_ts > RENDER_INTERVAL
+                            or len(accumulated_response) - last_render_len
+                            > RENDER_MIN_CHARS
+                        ):
+                            split = (
+                                max(
+                                    accumulated_response.rfind(" ", clickable_len),
+                                    accumulated_response.rfind("\n", clickable_len),
+                                )
+                                + 1
+                            )
+                            if split > clickable_len:
+                                clickable_prefix += make_urls_clickable(
+                                    accumulated_response[clickable_len:split]
+                                )
+                                clickable_len = split
+                            clickable_tail = make_urls_clickable(
+                                accumulated_response[clickable_len:]
+                            )
+                            message_placeholder.markdown(
+                                f'<div class="assistant-bubble streaming typing-cursor">{clickable_prefix}{clickable_tail}</div>',
+                                unsafe_allow_html=True,
+                            )
+                            last_render_ts = now
+                            last_render_len = len(accumulated_response)
 
             elapsed = time.time() - start_time
             answer = (
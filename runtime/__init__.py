@@ -0,0 +1 @@
+"""AgentCore Runtime server for the Customer Support Agent."""
@@ -8,56 +8,243 @@ to invoke Claude models via Amazon Bedrock.
 """
 
 import asyncio
-import json
+import dataclasses
+import functools
+import hashlib
 import logging
 import os
-import sys
+import queue
+import threading
+import time
+import types
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-from flask import Flask, Response, jsonify, request
+import orjson
+from flask import Flask, Response, request
+from werkzeug.exceptions import RequestEntityTooLarge
 
 # Ensure Bedrock backend is used
 os.environ["CLAUDE_CODE_USE_BEDROCK"] = "1"
 # Allow SDK to launch (unset nested-session guard if present)
 os.environ.pop("CLAUDECODE", None)
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Gunicorn is started from the project root so it can import runtime.app
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-from claude_agent_sdk import ClaudeAgentOptions, query
-
-from agent import prompt_stream
-from agent.mcp_server import get_mcp_server
-from agent.memory_hooks import (
-    CustomerSupportMemoryManager,
-    memory_client,
-)
-from agent.gateway_client import get_gateway_mcp_config
-from agent.prompts import SYSTEM_PROMPT
 from utils.aws_helpers import get_ssm_parameter
 
 logging.basicConfig(level=logging.INFO)
+# The default format doesn't print process or thread info, so skip
+# collecting it for every record
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+# Bound the size (and parse cost) of request bodies
+app.config["MAX_CONTENT_LENGTH"] = int(os.environ.get("MAX_CONTENT_LENGTH", 256 * 1024))
+
+# One event loop shared by all requests, running on a background thread.
+# Handlers submit coroutines to it rather than creating a loop per request.
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name="agent-loop", daemon=True).start()
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def _json_response(obj, status=200):
+    """Build a JSON response encoded with orjson."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+_STREAM_END = object()
+
+# Pre-encoded SSE framing
+SSE_DATA = b"data: "
+SSE_END = b"\n\n"
+SSE_DONE = b"data: [DONE]\n\n"
 
-# Initialize the in-process MCP server
-sdk_server = get_mcp_server()
 
-# Load memory ID from environment or SSM
-MEMORY_ID = os.environ.get("MEMORY_ID")
-if not MEMORY_ID:
+def _iter_async(agen):
+    """Drive an async generator on the shared loop, yielding its items here.
+
+    Items are handed over through a thread-safe queue so the WSGI response
+    generator can consume them without running an event loop of its own.
+    """
+    items = queue.Queue()
+
+    async def drain():
+        try:
+            async for item in agen:
+                items.put(item)
+        finally:
+            items.put(_STREAM_END)
+
+    future = asyncio.run_coroutine_threadsafe(drain(), _loop)
     try:
-        MEMORY_ID = get_ssm_parameter("/app/customersupport/agentcore/memory_id")
+        while (item := items.get()) is not _STREAM_END:
+            yield item
+        future.result()
+    finally:
+        future.cancel()
+
+
+_ALLOWED_TOOLS = ("mcp__customer-support__*", "mcp__agentcore-gateway__*")
+
+_agent_lock = threading.Lock()
+_agent_ns: Optional[types.SimpleNamespace] = None
+
+
+def _load_agent():
+    """Import the agent stack and build the shared SDK options.
+
+    Deferred until the first invocation so the server (and /ping) comes up
+    without paying for the Claude Agent SDK, MCP server and memory client
+    imports.
+    """
+    from claude_agent_sdk import (
+        AssistantMessage,
+        ClaudeAgentOptions,
+        ResultMessage,
+        TextBlock,
+        query,
+    )
+
+    from agent import prompt_stream
+    from agent.gateway_client import get_gateway_mcp_config
+    from agent.mcp_server import get_mcp_server
+    from agent.memory_hooks import CustomerSupportMemoryManager, memory_client
+    from agent.prompts import SYSTEM_PROMPT
+
+    # Claude Agent SDK options shared by every request; requests with gateway
+    # access get a copy with the gateway MCP server added. SYSTEM_PROMPT is
+    # passed unchanged so the cached system/tools prefix is reused;
+    # per-request memory context goes in the user turn after it.
+    base_mcp_servers = {"customer-support": get_mcp_server()}
+    base_options = ClaudeAgentOptions(
+        system_prompt=SYSTEM_PROMPT,
+        mcp_servers=base_mcp_servers,
+        allowed_tools=list(_ALLOWED_TOOLS),
+        permission_mode="bypassPermissions",
+        max_turns=10,
+    )
+
+    return types.SimpleNamespace(
+        AssistantMessage=AssistantMessage,
+        ResultMessage=ResultMessage,
+        TextBlock=TextBlock,
+        query=query,
+        prompt_stream=prompt_stream,
+        get_gateway_mcp_config=get_gateway_mcp_config,
+        CustomerSupportMemoryManager=CustomerSupportMemoryManager,
+        memory_client=memory_client,
+        base_mcp_servers=base_mcp_servers,
+        base_options=base_options,
+    )
+
+
+def _agent():
+    """Return the lazily initialized agent namespace.
+
+    The lock is only taken until the first load completes; after that the
+    cached namespace is returned without serializing request threads.
+    """
+    global _agent_ns
+    agent = _agent_ns
+    if agent is None:
+        with _agent_lock:
+            if _agent_ns is None:
+                _agent_ns = _load_agent()
+            agent = _agent_ns
+    return agent
+
+
+def _load_memory_id():
+    """Load the memory ID from SSM."""
+    try:
+        return get_ssm_parameter("/app/customersupport/agentcore/memory_id")
     except Exception:
         logger.warning("No memory ID found - running without memory")
-        MEMORY_ID = None
+        return None
+
+
+# Load memory ID from environment or SSM. When launched with PRODUCTION=1 the
+# ID resolved here is handed to the Gunicorn workers through the environment,
+# so there is one SSM lookup per server start and nothing to go stale.
+MEMORY_ID = os.environ.get("MEMORY_ID") or _load_memory_id()
+
+# Pool for the per-request memory and gateway lookups, which run
+# concurrently before the agent is invoked
+IO_TIMEOUT = 30
+_io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="invocation-io")
+
+
+def _get_memory_context(user_input, actor_id, session_id):
+    """Create a memory manager for the request and retrieve its context."""
+    agent = _agent()
+    memory_manager = agent.CustomerSupportMemoryManager(
+        memory_id=MEMORY_ID,
+        client=agent.memory_client,
+        actor_id=actor_id,
+        session_id=session_id,
+    )
+    return memory_manager, memory_manager.retrieve_context(user_input)
+
+
+# Cache of final responses for repeated non-streaming prompts. Only used when
+# memory isn't configured, since memory makes responses actor-specific.
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE_MAX_SIZE = 4096
+_response_cache: "OrderedDict[bytes, tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(enhanced_prompt, options):
+    """Hash the prompt and the set of configured MCP servers."""
+    key = hashlib.blake2b(enhanced_prompt.encode(), digest_size=16)
+    for name in sorted(options.mcp_servers):
+        key.update(b"\0" + name.encode())
+    return key.digest()
 
 
 @app.route("/ping", methods=["GET"])
 def ping():
     """Health check endpoint required by AgentCore Runtime."""
-    return jsonify({"status": "healthy"}), 200
+    return _json_response({"status": "healthy"})
+
+
+PING_BODY = b'{"status":"healthy"}'
+PING_HEADERS = [
+    ("Content-Type", "application/json"),
+    ("Content-Length", str(len(PING_BODY))),
+]
+
+
+def _ping_fast_path(wsgi_app):
+    """Answer GET /ping before Flask's request dispatch.
+
+    AgentCore polls the health check frequently. The Flask route above stays
+    registered so HEAD requests are still answered.
+    """
+
+    @functools.wraps(wsgi_app)
+    def wrapper(environ, start_response):
+        if environ.get("PATH_INFO") == "/ping" and environ["REQUEST_METHOD"] == "GET":
+            start_response("200 OK", PING_HEADERS)
+            return [PING_BODY]
+        return wsgi_app(environ, start_response)
+
+    return wrapper
+
+
+app.wsgi_app = _ping_fast_path(app.wsgi_app)
 
 
 @app.route("/invocations", methods=["POST"])
@@ -69,138 +256,218 @@ def invocations():
         - actor_id (str, optional): Customer identifier for memory
         - session_id (str, optional): Session identifier for continuity
         - stream (bool, optional): Whether to stream the response
+        - no_cache (bool, optional): Bypass the response cache
 
     Returns:
         JSON response with the agent's message.
     """
     try:
-        body = request.json or {}
+        if (request.content_length or 0) > app.config["MAX_CONTENT_LENGTH"]:
+            return _json_response({"error": "Payload too large"}, 413)
+        agent = _agent()
+        try:
+            body = orjson.loads(request.get_data() or b"{}") or {}
+        except orjson.JSONDecodeError:
+            return _json_response({"error": "Invalid JSON body"}, 400)
         user_input = body.get("prompt", "")
         actor_id = body.get("actor_id", "default_customer")
-        session_id = body.get("session_id", str(uuid.uuid4()))
+        session_id = body.get("session_id") or str(uuid.uuid4())
         stream = body.get("stream", False)
 
         if not user_input:
-            return jsonify({"error": "No prompt provided"}), 400
+            return _json_response({"error": "No prompt provided"}, 400)
 
-        # Get authorization header for gateway access
+        # Get the bearer token for gateway access
         auth_header = request.headers.get("Authorization", "")
+        bearer_token = (
+            auth_header.removeprefix("Bearer ").strip()
+            if auth_header.startswith("Bearer ")
+            else ""
+        )
 
-        # Build MCP servers config
-        mcp_servers = {"customer-support": sdk_server}
+        # Start memory retrieval and gateway resolution concurrently
+        memory_future = (
+            _io_pool.submit(_get_memory_context, user_input, actor_id, session_id)
+            if MEMORY_ID
+            else None
+        )
+        # The gateway URL lookup is TTL-cached in gateway_client, so this
+        # only builds the per-token headers once warm; no per-token cache is
+        # kept so raw tokens aren't retained.
+        gateway_future = (
+            _io_pool.submit(agent.get_gateway_mcp_config, bearer_token=bearer_token)
+            if bearer_token
+            else None
+        )
 
-        # Add gateway if auth header is available
-        if auth_header:
+        # Use the base options, adding the gateway MCP server if available
+        options = agent.base_options
+        if gateway_future:
             try:
-                gateway_config = get_gateway_mcp_config(
-                    bearer_token=auth_header.replace("Bearer ", "")
+                gateway_config = gateway_future.result(timeout=IO_TIMEOUT)
+                options = dataclasses.replace(
+                    agent.base_options,
+                    mcp_servers={
+                        **agent.base_mcp_servers,
+                        "agentcore-gateway": gateway_config,
+                    },
                 )
-                mcp_servers["agentcore-gateway"] = gateway_config
             except Exception as e:
-                logger.warning(f"Could not configure gateway: {e}")
+                logger.warning("Could not configure gateway: %s", e)
 
         # Retrieve memory context if available
         enhanced_prompt = user_input
         memory_manager = None
 
-        if MEMORY_ID:
+        if memory_future:
             try:
-                memory_manager = CustomerSupportMemoryManager(
-                    memory_id=MEMORY_ID,
-                    client=memory_client,
-                    actor_id=actor_id,
-                    session_id=session_id,
-                )
-                context = memory_manager.retrieve_context(user_input)
+                memory_manager, context = memory_future.result(timeout=IO_TIMEOUT)
                 if context:
                     enhanced_prompt = f"Customer Context:\n{context}\n\n{user_input}"
             except Exception as e:
-                logger.warning(f"Memory retrieval failed: {e}")
-
-        # Build Claude Agent SDK options
-        options = ClaudeAgentOptions(
-            system_prompt=SYSTEM_PROMPT,
-            mcp_servers=mcp_servers,
-            allowed_tools=["mcp__customer-support__*", "mcp__agentcore-gateway__*"],
-            permission_mode="bypassPermissions",
-            max_turns=10,
-        )
+                logger.warning("Memory retrieval failed: %s", e)
 
         if stream:
             return _stream_response(enhanced_prompt, options, memory_manager, user_input)
         else:
-            return _sync_response(enhanced_prompt, options, memory_manager, user_input)
-
+            # Memory makes responses actor-specific, so only cache when memory
+            # isn't configured at all; a failed lookup must not fall through
+            # to the shared cache
+            use_cache = not MEMORY_ID and not body.get("no_cache", False)
+            return _sync_response(
+                enhanced_prompt, options, memory_manager, user_input, use_cache
+            )
+
+    except RequestEntityTooLarge:
+        # Bodies sent without a Content-Length are only caught while reading
+        return _json_response({"error": "Payload too large"}, 413)
     except Exception as e:
-        logger.error(f"Invocation error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        logger.error("Invocation error: %s", e)
+        return _json_response({"error": str(e)}, 500)
 
 
-def _sync_response(enhanced_prompt, options, memory_manager, original_query):
+def _sync_response(
+    enhanced_prompt, options, memory_manager, original_query, use_cache=False
+):
     """Handle synchronous (non-streaming) response."""
+    if use_cache:
+        cache_key = _response_cache_key(enhanced_prompt, options)
+        with _response_cache_lock:
+            entry = _response_cache.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                _response_cache.move_to_end(cache_key)
+                return _json_response({"message": entry[1]})
+
+    agent = _agent()
     response_text = ""
 
     async def run_agent():
         nonlocal response_text
-        async for msg in query(prompt=prompt_stream(enhanced_prompt), options=options):
+        async for msg in agent.query(
+            prompt=agent.prompt_stream(enhanced_prompt), options=options
+        ):
             if hasattr(msg, "result"):
                 response_text = msg.result
 
-    asyncio.run(run_agent())
+    _run_async(run_agent())
+
+    if use_cache and response_text:
+        with _response_cache_lock:
+            _response_cache[cache_key] = (
+                time.monotonic() + RESPONSE_CACHE_TTL,
+                response_text,
+            )
+            _response_cache.move_to_end(cache_key)
+            while len(_response_cache) > RESPONSE_CACHE_MAX_SIZE:
+                _response_cache.popitem(last=False)
 
     # Save interaction to memory
     if memory_manager and response_text:
         try:
             memory_manager.save_interaction(original_query, response_text)
         except Exception as e:
-            logger.warning(f"Failed to save to memory: {e}")
+            logger.warning("Failed to save to memory: %s", e)
+
+    return _json_response({"message": response_text})
 
-    return jsonify({"message": response_text})
+
+def _sse_event(text):
+    """Frame text as one SSE event.
+
+    The text is sent as a JSON string so newlines inside a TextBlock stay
+    within a single data: line.
+    """
+    return SSE_DATA + orjson.dumps(text) + SSE_END
 
 
 def _stream_response(enhanced_prompt, options, memory_manager, original_query):
     """Handle streaming (SSE) response."""
 
+    agent = _agent()
+
+    async def run_agent():
+        """Yield assistant text as it arrives, then the final ResultMessage."""
+        async for msg in agent.query(
+            prompt=agent.prompt_stream(enhanced_prompt), options=options
+        ):
+            if isinstance(msg, agent.AssistantMessage):
+                for block in msg.content:
+                    if isinstance(block, agent.TextBlock):
+                        yield block.text
+            elif isinstance(msg, agent.ResultMessage):
+                yield msg
+
     def generate():
         response_text = ""
+        streamed = []
 
-        async def run_agent():
-            nonlocal response_text
-            async for msg in query(prompt=prompt_stream(enhanced_prompt), options=options):
-                if hasattr(msg, "content"):
-                    chunk = msg.content
-                    response_text += chunk
-                    yield f"data: {chunk}\n\n"
-                elif hasattr(msg, "result"):
-                    response_text = msg.result
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            gen = run_agent()
-            # Collect and yield from async generator
-            while True:
-                try:
-                    chunk = loop.run_until_complete(gen.__anext__())
-                    yield chunk
-                except StopAsyncIteration:
-                    break
-        finally:
-            loop.close()
+        for item in _iter_async(run_agent()):
+            if isinstance(item, agent.ResultMessage):
+                response_text = item.result or ""
+                continue
+            streamed.append(item)
+            yield _sse_event(item)
+
+        if not response_text:
+            response_text = "".join(streamed)
 
         # Save interaction to memory
         if memory_manager and response_text:
             try:
                 memory_manager.save_interaction(original_query, response_text)
             except Exception as e:
-                logger.warning(f"Failed to save to memory: {e}")
+                logger.warning("Failed to save to memory: %s", e)
 
-        yield "data: [DONE]\n\n"
+        yield SSE_DONE
 
     return Response(generate(), mimetype="text/event-stream")
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
-    logger.info(f"Starting Customer Support Agent on port {port}")
+    if os.environ.get("PRODUCTION") == "1":
+        # Replace this process with Gunicorn so slow Bedrock calls don't hold
+        # up other requests or health checks
+        workers = os.environ.get("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+        logger.info(
+            "Starting Customer Support Agent with Gunicorn on port %d (%s workers)",
+            port,
+            workers,
+        )
+        if MEMORY_ID:
+            os.environ["MEMORY_ID"] = MEMORY_ID
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                f"--bind=0.0.0.0:{port}",
+                "--worker-class=gthread",
+                f"--threads={os.environ.get('GUNICORN_THREADS', '64')}",
+                f"--workers={workers}",
+                "--worker-tmp-dir=/dev/shm",
+                f"--chdir={PROJECT_ROOT}",
+                "runtime.app:app",
+            ],
+        )
+    logger.info("Starting Customer Support Agent on port %d", port)
     app.run(host="0.0.0.0", port=port, debug=False)
@@ -5,5 +5,5 @@ echo "Starting Customer Support Agent (Claude Agent SDK)..."
 echo "CLAUDE_CODE_USE_BEDROCK=${CLAUDE_CODE_USE_BEDROCK}"
 echo "PORT=${PORT:-8080}"
 
-# Run the Flask server
-exec python runtime/app.py
+# Run the Flask app (execs Gunicorn when PRODUCTION=1)
+exec python -m runtime.app
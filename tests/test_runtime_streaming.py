@@ -0,0 +1,71 @@
+"""Streaming (SSE) framing tests for runtime/app.py."""
+
+import os
+import types
+
+import pytest
+
+pytest.importorskip("flask")
+orjson = pytest.importorskip("orjson")
+pytest.importorskip("boto3")
+
+# Keep the import from looking up the memory ID in SSM
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("MEMORY_ID", "test-memory")
+
+from runtime import app as runtime_app  # noqa: E402
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class AssistantMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class ResultMessage:
+    def __init__(self, result):
+        self.result = result
+
+
+def _fake_agent(blocks):
+    async def query(prompt, options):
+        yield AssistantMessage([TextBlock(text) for text in blocks])
+        yield ResultMessage("".join(blocks))
+
+    return types.SimpleNamespace(
+        AssistantMessage=AssistantMessage,
+        ResultMessage=ResultMessage,
+        TextBlock=TextBlock,
+        query=query,
+        prompt_stream=lambda text: text,
+    )
+
+
+def _parse_events(body):
+    """Split an SSE body into events, checking every line is a data: line."""
+    events = []
+    for event in body.decode().split("\n\n"):
+        if not event:
+            continue
+        lines = event.split("\n")
+        assert all(line.startswith("data: ") for line in lines), event
+        events.append("\n".join(line[len("data: ") :] for line in lines))
+    return events
+
+
+def test_stream_keeps_multiline_text(monkeypatch):
+    blocks = [
+        "Here are the steps:\n\n1. Restart the laptop\n2. Update drivers\n",
+        'Still stuck? Reply with "help".\r\nThanks!',
+    ]
+    monkeypatch.setattr(runtime_app, "_agent", lambda: _fake_agent(blocks))
+
+    response = runtime_app._stream_response("prompt", None, None, "prompt")
+    events = _parse_events(response.get_data())
+
+    assert events[-1] == "[DONE]"
+    assert [orjson.loads(event) for event in events[:-1]] == blocks
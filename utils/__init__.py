@@ -2,6 +2,7 @@
 
 from utils.aws_helpers import (
     get_ssm_parameter,
+    get_ssm_parameters,
     put_ssm_parameter,
     delete_ssm_parameter,
     get_aws_region,
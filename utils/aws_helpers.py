@@ -5,26 +5,102 @@ and cleanup utilities for AgentCore resources.
 """
 
 import base64
-import hashlib
+import functools
 import hmac
-import json
 import os
+import threading
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
 import boto3
+import orjson
 import yaml
-from boto3.session import Session
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
-sts_client = boto3.client("sts")
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 
-REGION = boto3.session.Session().region_name
+# Clients are built from a dedicated session; boto3 sessions aren't
+# thread-safe, so creation is serialized by _client_lock
+boto_session = boto3.session.Session()
+REGION = boto_session.region_name
+
+# Shared by every client from _client(): a pool large enough for the
+# concurrent cleanup deletes, TCP keepalive for long-lived notebook sessions,
+# and adaptive retries so throttled calls back off client-side
+boto_config = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service: str):
+    """Return a shared client for service.
+
+    boto3 clients are thread-safe, so one per service keeps the loaded service
+    model and the HTTP connection pool around for every helper call. Only
+    client creation needs the lock; lru_cache doesn't serialize misses.
+    """
+    with _client_lock:
+        return boto_session.client(service, region_name=REGION, config=boto_config)
+
+
+sts_client = _client("sts")
 
 username = "testuser"
 sm_name = "customer_support_agent"
 
 role_name = f"CustomerSupportAssistantBedrockAgentCoreRole-{REGION}"
 policy_name = f"CustomerSupportAssistantBedrockAgentCorePolicy-{REGION}"
+# Repository the starter toolkit creates for the customer_support_agent runtime
+ecr_repository_name = "bedrock-agentcore-customer_support_agent"
+
+
+# Deletes in the cleanup helpers are independent API calls, so they are
+# issued concurrently (the shared clients' pools allow 50 connections)
+CLEANUP_WORKERS = 16
+
+
+# Error codes that mean a delete has nothing left to do
+NOT_FOUND_CODES = frozenset({"NoSuchEntity", "ResourceNotFoundException"})
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] in NOT_FOUND_CODES
+
+
+def _parallel(fn, items) -> list:
+    """Call fn on every item concurrently, re-raising the first failure."""
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(CLEANUP_WORKERS, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def _wait_empty(list_fn, key: str, timeout: float = 30) -> bool:
+    """Poll list_fn() with backoff until response[key] is empty.
+
+    Returns False if items are still listed after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.25
+    while True:
+        if not list_fn().get(key):
+            return True
+        if time.monotonic() + delay > deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 2)
 
 
 # ---------------------------------------------------------------------------
@@ -33,15 +109,28 @@ policy_name = f"CustomerSupportAssistantBedrockAgentCorePolicy-{REGION}"
 
 
 def get_ssm_parameter(name: str, with_decryption: bool = True) -> str:
-    ssm = boto3.client("ssm")
+    ssm = _client("ssm")
     response = ssm.get_parameter(Name=name, WithDecryption=with_decryption)
     return response["Parameter"]["Value"]
 
 
+def get_ssm_parameters(names: list[str], with_decryption: bool = True) -> dict:
+    """Read several parameters in one request.
+
+    Prefer this over repeated get_ssm_parameter() calls when two or more
+    values are needed. Returns a name -> value dict; missing names are left
+    out.
+    """
+    response = _client("ssm").get_parameters(
+        Names=names, WithDecryption=with_decryption
+    )
+    return {p["Name"]: p["Value"] for p in response["Parameters"]}
+
+
 def put_ssm_parameter(
     name: str, value: str, parameter_type: str = "String", with_encryption: bool = False
 ) -> None:
-    ssm = boto3.client("ssm")
+    ssm = _client("ssm")
     put_params = {
         "Name": name,
         "Value": value,
@@ -54,7 +143,7 @@ def put_ssm_parameter(
 
 
 def delete_ssm_parameter(name: str) -> None:
-    ssm = boto3.client("ssm")
+    ssm = _client("ssm")
     try:
         ssm.delete_parameter(Name=name)
     except ssm.exceptions.ParameterNotFound:
@@ -67,59 +156,68 @@ def delete_ssm_parameter(name: str) -> None:
 
 
 def load_api_spec(file_path: str) -> list:
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = orjson.loads(f.read())
     if not isinstance(data, list):
         raise ValueError("Expected a list in the JSON file")
     return data
 
 
 def get_aws_region() -> str:
-    session = Session()
-    return session.region_name
+    return REGION
 
 
+@functools.lru_cache(maxsize=1)
 def get_aws_account_id() -> str:
-    sts = boto3.client("sts")
-    return sts.get_caller_identity()["Account"]
+    return _client("sts").get_caller_identity()["Account"]
 
 
 def get_cognito_client_secret() -> str:
-    client = boto3.client("cognito-idp")
+    client = _client("cognito-idp")
+    params = get_ssm_parameters(
+        [
+            "/app/customersupport/agentcore/pool_id",
+            "/app/customersupport/agentcore/client_id",
+        ]
+    )
     response = client.describe_user_pool_client(
-        UserPoolId=get_ssm_parameter("/app/customersupport/agentcore/pool_id"),
-        ClientId=get_ssm_parameter("/app/customersupport/agentcore/client_id"),
+        UserPoolId=params["/app/customersupport/agentcore/pool_id"],
+        ClientId=params["/app/customersupport/agentcore/client_id"],
     )
     return response["UserPoolClient"]["ClientSecret"]
 
 
 def read_config(file_path: str) -> Dict[str, Any]:
     """Read configuration from a JSON or YAML file."""
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
-
     _, ext = os.path.splitext(file_path.lower())
 
+    # Read the raw bytes once; orjson and libyaml both parse UTF-8 bytes
+    # directly, so there is no decode pass and no re-read for the fallback
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            if ext == ".json":
-                return json.load(file)
-            elif ext in [".yaml", ".yml"]:
-                return yaml.safe_load(file)
-            else:
-                content = file.read()
-                file.seek(0)
+        with open(file_path, "rb") as file:
+            content = file.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    except OSError as e:
+        raise ValueError(f"Error reading configuration file {file_path}: {e}")
+
+    try:
+        if ext == ".json":
+            return orjson.loads(content)
+        elif ext in [".yaml", ".yml"]:
+            return yaml.load(content, Loader=YamlLoader)
+        else:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
                 try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    try:
-                        return yaml.safe_load(content)
-                    except yaml.YAMLError:
-                        raise ValueError(
-                            f"Unsupported configuration file format: {ext}. "
-                            f"Supported formats: .json, .yaml, .yml"
-                        )
-    except json.JSONDecodeError as e:
+                    return yaml.load(content, Loader=YamlLoader)
+                except yaml.YAMLError:
+                    raise ValueError(
+                        f"Unsupported configuration file format: {ext}. "
+                        f"Supported formats: .json, .yaml, .yml"
+                    )
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in configuration file {file_path}: {e}")
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in configuration file {file_path}: {e}")
@@ -134,9 +232,7 @@ def read_config(file_path: str) -> Dict[str, Any]:
 
 def save_customer_support_secret(secret_value):
     """Save a secret in AWS Secrets Manager."""
-    boto_session = Session()
-    region = boto_session.region_name
-    secrets_client = boto3.client("secretsmanager", region_name=region)
+    secrets_client = _client("secretsmanager")
 
     try:
         secrets_client.create_secret(
@@ -156,9 +252,7 @@ def save_customer_support_secret(secret_value):
 
 def get_customer_support_secret():
     """Get a secret value from AWS Secrets Manager."""
-    boto_session = Session()
-    region = boto_session.region_name
-    secrets_client = boto3.client("secretsmanager", region_name=region)
+    secrets_client = _client("secretsmanager")
     try:
         response = secrets_client.get_secret_value(SecretId=sm_name)
         return response["SecretString"]
@@ -169,13 +263,18 @@ def get_customer_support_secret():
 
 def delete_customer_support_secret():
     """Delete a secret from AWS Secrets Manager."""
-    boto_session = Session()
-    region = boto_session.region_name
-    secrets_client = boto3.client("secretsmanager", region_name=region)
+    invalidate_cognito_cache()
+    secrets_client = _client("secretsmanager")
     try:
         secrets_client.delete_secret(SecretId=sm_name, ForceDeleteWithoutRecovery=True)
         print("Deleted secret!")
         return True
+    except ClientError as e:
+        if _is_not_found(e):
+            print("Secret not found. It may have already been deleted.")
+            return True
+        print(f"Error deleting secret: {str(e)}")
+        return False
     except Exception as e:
         print(f"Error deleting secret: {str(e)}")
         return False
@@ -185,18 +284,36 @@ def delete_customer_support_secret():
 # Cognito
 # ---------------------------------------------------------------------------
 
+# Parsed Cognito config from Secrets Manager, kept for the life of the process
+_cognito_config: Optional[dict] = None
+
+
+@functools.lru_cache(maxsize=32)
+def _cognito_secret_hash(user: str, client_id: str, client_secret: str) -> str:
+    """Compute the SECRET_HASH Cognito expects for app clients with a secret."""
+    message = (user + client_id).encode()
+    digest = hmac.digest(client_secret.encode(), message, "sha256")
+    return base64.b64encode(digest).decode()
+
+
+def invalidate_cognito_cache() -> None:
+    """Forget the cached Cognito config so the next lookup re-reads the secret."""
+    global _cognito_config
+    _cognito_config = None
+
 
 def get_or_create_cognito_pool(refresh_token=False):
-    boto_session = Session()
-    region = boto_session.region_name
-    cognito_client = boto3.client("cognito-idp", region_name=region)
+    global _cognito_config
+    cognito_client = _client("cognito-idp")
     try:
-        cognito_config_str = get_customer_support_secret()
-        cognito_config = json.loads(cognito_config_str)
+        cognito_config = _cognito_config
+        if cognito_config is None:
+            cognito_config = orjson.loads(get_customer_support_secret())
         if refresh_token:
             cognito_config["bearer_token"] = reauthenticate_user(
                 cognito_config["client_id"], cognito_config["client_secret"]
             )
+        _cognito_config = cognito_config
         return cognito_config
     except Exception:
         print("No existing cognito config found. Creating a new one..")
@@ -234,11 +351,7 @@ def get_or_create_cognito_pool(refresh_token=False):
             Permanent=True,
         )
 
-        message = bytes(username + client_id, "utf-8")
-        key = bytes(client_secret, "utf-8")
-        secret_hash = base64.b64encode(
-            hmac.new(key, message, digestmod=hashlib.sha256).digest()
-        ).decode()
+        secret_hash = _cognito_secret_hash(username, client_id, client_secret)
 
         auth_response = cognito_client.initiate_auth(
             ClientId=client_id,
@@ -250,7 +363,7 @@ def get_or_create_cognito_pool(refresh_token=False):
             },
         )
         bearer_token = auth_response["AuthenticationResult"]["AccessToken"]
-        discovery_url = f"https://cognito-idp.{region}.amazonaws.com/{pool_id}/.well-known/openid-configuration"
+        discovery_url = f"https://cognito-idp.{REGION}.amazonaws.com/{pool_id}/.well-known/openid-configuration"
 
         print(f"Pool id: {pool_id}")
         print(f"Discovery URL: {discovery_url}")
@@ -265,15 +378,23 @@ def get_or_create_cognito_pool(refresh_token=False):
             "bearer_token": bearer_token,
             "discovery_url": discovery_url,
         }
-        put_ssm_parameter("/app/customersupport/agentcore/client_id", client_id)
-        put_ssm_parameter("/app/customersupport/agentcore/pool_id", pool_id)
-        put_ssm_parameter(
-            "/app/customersupport/agentcore/cognito_discovery_url", discovery_url
+        # SSM has no batch put, so write the four parameters concurrently
+        _parallel(
+            lambda item: put_ssm_parameter(*item),
+            [
+                ("/app/customersupport/agentcore/client_id", client_id),
+                ("/app/customersupport/agentcore/pool_id", pool_id),
+                (
+                    "/app/customersupport/agentcore/cognito_discovery_url",
+                    discovery_url,
+                ),
+                ("/app/customersupport/agentcore/client_secret", client_secret),
+            ],
         )
-        put_ssm_parameter("/app/customersupport/agentcore/client_secret", client_secret)
 
-        save_customer_support_secret(json.dumps(cognito_config))
+        save_customer_support_secret(orjson.dumps(cognito_config).decode())
 
+        _cognito_config = cognito_config
         return cognito_config
     except Exception as e:
         print(f"Error: {e}")
@@ -282,31 +403,46 @@ def get_or_create_cognito_pool(refresh_token=False):
 
 def cleanup_cognito_resources(pool_id):
     """Delete Cognito resources including users, app clients, and user pool."""
+    invalidate_cognito_cache()
     try:
-        boto_session = Session()
-        region = boto_session.region_name
-        cognito_client = boto3.client("cognito-idp", region_name=region)
+        cognito_client = _client("cognito-idp")
 
         if pool_id:
             try:
-                clients_response = cognito_client.list_user_pool_clients(
-                    UserPoolId=pool_id, MaxResults=60
-                )
-                for client in clients_response["UserPoolClients"]:
+                clients = [
+                    client
+                    for page in cognito_client.get_paginator(
+                        "list_user_pool_clients"
+                    ).paginate(UserPoolId=pool_id, MaxResults=60)
+                    for client in page["UserPoolClients"]
+                ]
+
+                def delete_client(client):
                     print(f"Deleting app client: {client['ClientName']}")
                     cognito_client.delete_user_pool_client(
                         UserPoolId=pool_id, ClientId=client["ClientId"]
                     )
 
-                users_response = cognito_client.list_users(
-                    UserPoolId=pool_id, AttributesToGet=["email"]
-                )
-                for user in users_response.get("Users", []):
+                _parallel(delete_client, clients)
+
+                # Collect every page before deleting so the pagination token
+                # isn't invalidated under us
+                users = [
+                    user
+                    for page in cognito_client.get_paginator("list_users").paginate(
+                        UserPoolId=pool_id, AttributesToGet=["email"]
+                    )
+                    for user in page.get("Users", [])
+                ]
+
+                def delete_user(user):
                     print(f"Deleting user: {user['Username']}")
                     cognito_client.admin_delete_user(
                         UserPoolId=pool_id, Username=user["Username"]
                     )
 
+                _parallel(delete_user, users)
+
                 print(f"Deleting user pool: {pool_id}")
                 cognito_client.delete_user_pool(UserPoolId=pool_id)
                 print("Successfully cleaned up all Cognito resources")
@@ -328,15 +464,9 @@ def cleanup_cognito_resources(pool_id):
 
 
 def reauthenticate_user(client_id, client_secret):
-    boto_session = Session()
-    region = boto_session.region_name
-    cognito_client = boto3.client("cognito-idp", region_name=region)
+    cognito_client = _client("cognito-idp")
 
-    message = bytes(username + client_id, "utf-8")
-    key = bytes(client_secret, "utf-8")
-    secret_hash = base64.b64encode(
-        hmac.new(key, message, digestmod=hashlib.sha256).digest()
-    ).decode()
+    secret_hash = _cognito_secret_hash(username, client_id, client_secret)
 
     auth_response = cognito_client.initiate_auth(
         ClientId=client_id,
@@ -356,12 +486,9 @@ def reauthenticate_user(client_id, client_secret):
 # ---------------------------------------------------------------------------
 
 
-def create_agentcore_runtime_execution_role():
-    iam = boto3.client("iam")
-    boto_session = Session()
-    region = boto_session.region_name
-    account_id = get_aws_account_id()
-
+@functools.lru_cache(maxsize=4)
+def _build_trust_policy(account_id: str, region: str) -> str:
+    """Return the runtime role's trust policy as a JSON string."""
     trust_policy = {
         "Version": "2012-10-17",
         "Statement": [
@@ -379,7 +506,12 @@ def create_agentcore_runtime_execution_role():
             }
         ],
     }
+    return orjson.dumps(trust_policy).decode()
 
+
+@functools.lru_cache(maxsize=4)
+def _build_policy_document(account_id: str, region: str) -> str:
+    """Return the runtime role's permissions policy as a JSON string."""
     policy_document = {
         "Version": "2012-10-17",
         "Statement": [
@@ -491,38 +623,42 @@ def create_agentcore_runtime_execution_role():
             },
         ],
     }
+    return orjson.dumps(policy_document).decode()
+
+
+def create_agentcore_runtime_execution_role():
+    iam = _client("iam")
+    account_id = get_aws_account_id()
 
     try:
+        # Create first and only look the role up if it already exists, which
+        # saves a round trip on a fresh account
         try:
+            role_response = iam.create_role(
+                RoleName=role_name,
+                AssumeRolePolicyDocument=_build_trust_policy(account_id, REGION),
+                Description="IAM role for Amazon Bedrock AgentCore with required permissions",
+            )
+        except iam.exceptions.EntityAlreadyExistsException:
             existing_role = iam.get_role(RoleName=role_name)
             print(f"Role {role_name} already exists")
             print(f"Role ARN: {existing_role['Role']['Arn']}")
             return existing_role["Role"]["Arn"]
-        except iam.exceptions.NoSuchEntityException:
-            pass
-
-        role_response = iam.create_role(
-            RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
-            Description="IAM role for Amazon Bedrock AgentCore with required permissions",
-        )
 
         print(f"Created IAM role: {role_name}")
         print(f"Role ARN: {role_response['Role']['Arn']}")
 
-        policy_arn = f"arn:aws:iam::{account_id}:policy/{policy_name}"
-
         try:
-            iam.get_policy(PolicyArn=policy_arn)
-            print(f"Policy {policy_name} already exists")
-        except iam.exceptions.NoSuchEntityException:
             policy_response = iam.create_policy(
                 PolicyName=policy_name,
-                PolicyDocument=json.dumps(policy_document),
+                PolicyDocument=_build_policy_document(account_id, REGION),
                 Description="Policy for Amazon Bedrock AgentCore permissions",
             )
             print(f"Created policy: {policy_name}")
             policy_arn = policy_response["Policy"]["Arn"]
+        except iam.exceptions.EntityAlreadyExistsException:
+            print(f"Policy {policy_name} already exists")
+            policy_arn = f"arn:aws:iam::{account_id}:policy/{policy_name}"
 
         try:
             iam.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
@@ -547,29 +683,32 @@ def create_agentcore_runtime_execution_role():
 
 
 def delete_agentcore_runtime_execution_role():
-    iam = boto3.client("iam")
+    iam = _client("iam")
 
     try:
-        account_id = boto3.client("sts").get_caller_identity()["Account"]
+        account_id = get_aws_account_id()
         policy_arn = f"arn:aws:iam::{account_id}:policy/{policy_name}"
 
         try:
             iam.detach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
             print("Detached policy from role")
-        except Exception:
-            pass
+        except ClientError as e:
+            if not _is_not_found(e):
+                raise
 
         try:
             iam.delete_role(RoleName=role_name)
             print(f"Deleted role: {role_name}")
-        except Exception:
-            pass
+        except ClientError as e:
+            if not _is_not_found(e):
+                raise
 
         try:
             iam.delete_policy(PolicyArn=policy_arn)
             print(f"Deleted policy: {policy_name}")
-        except Exception:
-            pass
+        except ClientError as e:
+            if not _is_not_found(e):
+                raise
 
         delete_ssm_parameter(
             "/app/customersupport/agentcore/runtime_execution_role_arn"
@@ -586,64 +725,66 @@ def delete_agentcore_runtime_execution_role():
 
 def agentcore_memory_cleanup(memory_id: str = None):
     """Delete AgentCore memories."""
-    control_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
+    control_client = _client("bedrock-agentcore-control")
     if memory_id:
         response = control_client.delete_memory(memoryId=memory_id)
         print(f"Successfully deleted memory: {memory_id}")
     else:
-        next_token = None
-        while True:
-            params = {}
-            if next_token:
-                params["nextToken"] = next_token
-            try:
-                response = control_client.list_memories(**params)
-                for memory in response.get("memories", []):
-                    mid = memory.get("id")
-                    print(f"\nMemory ID: {mid}")
-                    print(f"Status: {memory.get('status')}")
-                    control_client.delete_memory(memoryId=mid)
-                    print(f"Successfully deleted memory: {mid}")
-
-                response = control_client.list_memories(**params)
-                for memory in response.get("memories", []):
-                    mid = memory.get("id")
-                    print(f"\nMemory ID: {mid}")
-                    print(f"Status: {memory.get('status')}")
 
-            except Exception as e:
-                print(f"Error getting memory details: {e}")
+        def delete(memory):
+            mid = memory.get("id")
+            print(f"\nMemory ID: {mid}")
+            print(f"Status: {memory.get('status')}")
+            control_client.delete_memory(memoryId=mid)
+            print(f"Successfully deleted memory: {mid}")
 
-            next_token = response.get("nextToken")
-            if not next_token:
-                break
+        try:
+            memories = [
+                memory
+                for page in control_client.get_paginator("list_memories").paginate()
+                for memory in page.get("memories", [])
+            ]
+            _parallel(delete, memories)
+        except Exception as e:
+            print(f"Error getting memory details: {e}")
 
 
 def gateway_target_cleanup(gateway_id: str = None):
-    gateway_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
+    gateway_client = _client("bedrock-agentcore-control")
 
     if not gateway_id:
         response = gateway_client.list_gateways()
         gateway_id = response["items"][0]["gatewayId"]
     print(f"Deleting all targets for gateway: {gateway_id}")
 
-    list_response = gateway_client.list_gateway_targets(
-        gatewayIdentifier=gateway_id, maxResults=100
-    )
+    targets = [
+        item
+        for page in gateway_client.get_paginator("list_gateway_targets").paginate(
+            gatewayIdentifier=gateway_id
+        )
+        for item in page["items"]
+    ]
 
-    targets_deleted = False
-    for item in list_response["items"]:
+    def delete(item):
         target_id = item["targetId"]
         print(f"   Deleting target: {target_id}")
         gateway_client.delete_gateway_target(
             gatewayIdentifier=gateway_id, targetId=target_id
         )
         print(f"   Target {target_id} deleted")
-        targets_deleted = True
 
-    if targets_deleted:
+    if _parallel(delete, targets):
         print("Waiting for target deletions to propagate...")
-        time.sleep(5)
+        if not _wait_empty(
+            lambda: gateway_client.list_gateway_targets(
+                gatewayIdentifier=gateway_id, maxResults=1
+            ),
+            "items",
+        ):
+            print(
+                "Warning: target deletions still propagating after timeout, "
+                "deleting anyway"
+            )
 
     print(f"Deleting gateway: {gateway_id}")
     gateway_client.delete_gateway(gatewayIdentifier=gateway_id)
@@ -652,10 +793,8 @@ def gateway_target_cleanup(gateway_id: str = None):
 
 def runtime_resource_cleanup(runtime_arn: str = None):
     try:
-        agentcore_control_client = boto3.client(
-            "bedrock-agentcore-control", region_name=REGION
-        )
-        ecr_client = boto3.client("ecr", region_name=REGION)
+        agentcore_control_client = _client("bedrock-agentcore-control")
+        ecr_client = _client("ecr")
         if runtime_arn:
             runtime_id = runtime_arn.split(":")[-1].split("/")[-1]
             response = agentcore_control_client.delete_agent_runtime(
@@ -663,21 +802,28 @@ def runtime_resource_cleanup(runtime_arn: str = None):
             )
             print(f"  Agent runtime deleted: {response['status']}")
         else:
-            runtimes = agentcore_control_client.list_agent_runtimes()
-            for runtime in runtimes["agentRuntimes"]:
+            runtimes = [
+                runtime
+                for page in agentcore_control_client.get_paginator(
+                    "list_agent_runtimes"
+                ).paginate()
+                for runtime in page["agentRuntimes"]
+            ]
+
+            def delete(runtime):
                 response = agentcore_control_client.delete_agent_runtime(
                     agentRuntimeId=runtime["agentRuntimeId"]
                 )
                 print(f"  Agent runtime deleted: {response['status']}")
 
+            _parallel(delete, runtimes)
+
         print("  Deleting ECR repository...")
-        repositories = ecr_client.describe_repositories()
-        for repo in repositories["repositories"]:
-            if "bedrock-agentcore-customer_support_agent" in repo["repositoryName"]:
-                ecr_client.delete_repository(
-                    repositoryName=repo["repositoryName"], force=True
-                )
-                print(f"  ECR repository deleted: {repo['repositoryName']}")
+        try:
+            ecr_client.delete_repository(repositoryName=ecr_repository_name, force=True)
+            print(f"  ECR repository deleted: {ecr_repository_name}")
+        except ecr_client.exceptions.RepositoryNotFoundException:
+            print(f"  ECR repository {ecr_repository_name} doesn't exist")
 
     except Exception as e:
         print(f"  Error during runtime cleanup: {e}")
@@ -686,7 +832,7 @@ def runtime_resource_cleanup(runtime_arn: str = None):
 def delete_observability_resources():
     log_group_name = "agents/customer-support-assistant-logs"
     log_stream_name = "default"
-    logs_client = boto3.client("logs", region_name=REGION)
+    logs_client = _client("logs")
 
     try:
         print(f"  Deleting log stream '{log_stream_name}'...")
@@ -694,21 +840,25 @@ def delete_observability_resources():
             logGroupName=log_group_name, logStreamName=log_stream_name
         )
         print(f"  Log stream '{log_stream_name}' deleted successfully")
-    except Exception as e:
-        if hasattr(e, "response") and e.response["Error"]["Code"] == "ResourceNotFoundException":
+    except ClientError as e:
+        if _is_not_found(e):
             print(f"  Log stream '{log_stream_name}' doesn't exist")
         else:
             print(f"  Error deleting log stream: {e}")
+    except Exception as e:
+        print(f"  Error deleting log stream: {e}")
 
     try:
         print(f"  Deleting log group '{log_group_name}'...")
         logs_client.delete_log_group(logGroupName=log_group_name)
         print(f"  Log group '{log_group_name}' deleted successfully")
-    except Exception as e:
-        if hasattr(e, "response") and e.response["Error"]["Code"] == "ResourceNotFoundException":
+    except ClientError as e:
+        if _is_not_found(e):
             print(f"  Log group '{log_group_name}' doesn't exist")
         else:
             print(f"  Error deleting log group: {e}")
+    except Exception as e:
+        print(f"  Error deleting log group: {e}")
 
 
 def local_file_cleanup():
@@ -724,15 +874,14 @@ def local_file_cleanup():
     missing_files = []
 
     for file in files_to_delete:
-        if os.path.exists(file):
-            try:
-                os.unlink(file)
-                deleted_files.append(file)
-                print(f"  Deleted {file}")
-            except Exception as e:
-                print(f"  Error deleting {file}: {e}")
-        else:
+        try:
+            os.unlink(file)
+            deleted_files.append(file)
+            print(f"  Deleted {file}")
+        except FileNotFoundError:
             missing_files.append(file)
+        except OSError as e:
+            print(f"  Error deleting {file}: {e}")
 
     if deleted_files:
         print(f"\nSuccessfully deleted {len(deleted_files)} files")
@@ -741,7 +890,7 @@ def local_file_cleanup():
 
 
 def policy_engine_cleanup(policy_engine_id: str = None):
-    policy_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
+    policy_client = _client("bedrock-agentcore-control")
 
     if not policy_engine_id:
         response = policy_client.list_policy_engines()
@@ -753,17 +902,24 @@ def policy_engine_cleanup(policy_engine_id: str = None):
         policyEngineId=policy_engine_id, maxResults=100
     )
 
-    policies_deleted = False
-    for item in list_response["policies"]:
+    def delete(item):
         policy_id = item["policyId"]
         print(f"   Deleting policy: {policy_id}")
         policy_client.delete_policy(policyEngineId=policy_engine_id, policyId=policy_id)
         print(f"   Policy {policy_id} deleted")
-        policies_deleted = True
 
-    if policies_deleted:
+    if _parallel(delete, list_response["policies"]):
         print("Waiting for policy deletions to propagate...")
-        time.sleep(5)
+        if not _wait_empty(
+            lambda: policy_client.list_policies(
+                policyEngineId=policy_engine_id, maxResults=1
+            ),
+            "policies",
+        ):
+            print(
+                "Warning: policy deletions still propagating after timeout, "
+                "deleting anyway"
+            )
 
     print(f"Deleting policy engine: {policy_engine_id}")
     policy_client.delete_policy_engine(policyEngineId=policy_engine_id)